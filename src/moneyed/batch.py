@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Helpers for bulk arithmetic over many money amounts.
+
+Money objects are convenient but not free; portfolio- and ledger-style
+code that crunches thousands of amounts at once is better off working
+on plain integer minor units (cents) and converting to Money at the
+edges - see Money.from_minor and Currency.exponent.  When numba is
+installed the kernels below are JIT-compiled to native code; otherwise
+the pure-Python versions are used transparently.
+"""
+from __future__ import division
+from __future__ import unicode_literals
+
+from moneyed.classes import Money
+
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+
+def _sum_minor(values):
+    total = 0
+    for value in values:
+        total += value
+    return total
+
+
+def _add_minor(a, b):
+    if len(a) != len(b):
+        raise ValueError('add_minor() requires sequences of equal length')
+    return [a[i] + b[i] for i in range(len(a))]
+
+
+if _numba is not None:
+    sum_minor = _numba.njit(cache=True)(_sum_minor)
+    add_minor = _numba.njit(cache=True)(_add_minor)
+else:
+    sum_minor = _sum_minor
+    add_minor = _add_minor
+
+sum_minor.__doc__ = """Sum a sequence of integer minor-unit amounts."""
+add_minor.__doc__ = """Add two equal-length sequences of integer
+minor-unit amounts element-wise."""
+
+
+def from_minor(values, currency):
+    """
+    Convert a sequence of integer minor-unit amounts into a list of
+    Money instances in the given currency.
+    """
+    make = Money.from_minor
+    return [make(value, currency) for value in values]
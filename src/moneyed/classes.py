@@ -2,11 +2,41 @@
 from __future__ import division
 from __future__ import unicode_literals
 
+import decimal
+import sys
+import warnings
 from decimal import Decimal, ROUND_DOWN
 
+# CPython ships the C implementation of decimal (_decimal) since 3.3;
+# the pure-Python fallback is orders of magnitude slower at the
+# arithmetic Money leans on, so complain loudly if that is what we got.
+if not hasattr(decimal, '__libmpdec_version__'):
+    warnings.warn('moneyed is running on the pure-Python decimal '
+                  'implementation; Money arithmetic will be slow',
+                  RuntimeWarning)
+
 # Default, non-existent, currency
 DEFAULT_CURRENCY_CODE = 'XYZ'
 
+# Deprecation messages are module-level constants so the operator hot
+# paths do not rebuild the string every time a float sneaks in, and so
+# the warning registry can deduplicate on the same object.
+_FLOAT_MUL_WARNING = 'Multiplying Money instances with floats is deprecated'
+_FLOAT_DIV_WARNING = 'Dividing Money instances by floats is deprecated'
+_FLOAT_MOD_WARNING = ('Calculating percentages of Money instances with '
+                      'floats is deprecated')
+
+# Error messages shared by the arithmetic operators, hoisted for the
+# same reason.
+_ADD_NON_MONEY_MSG = 'Cannot add or subtract a Money and non-Money instance.'
+_CURRENCY_MISMATCH_MSG = ('Cannot add or subtract two Money instances with '
+                          'different currencies.')
+
+# Country lists are rarely consulted by Money-using code, so they are
+# kept out of the Currency instances themselves and served on demand
+# through the Currency.countries property, keyed by currency code.
+_COUNTRIES = {}
+
 
 class Currency(object):
     """
@@ -17,11 +47,61 @@ class Currency(object):
     rate - the last remains unimplemented however.
     """
 
-    def __init__(self, code='', numeric='999', name='', countries=[]):
+    # No per-instance __dict__: the registry holds one instance per ISO
+    # code, but Money objects exist by the million and each one keeps a
+    # currency reference hot.
+    __slots__ = ('code', 'name', 'numeric', 'exponent', '_quantum',
+                 '_countries')
+
+    def __init__(self, code='', numeric='999', name='', countries=None,
+                 exponent=2):
         self.code = code
-        self.countries = countries
+        # Explicitly passed countries are kept on the instance (as a
+        # tuple: immutable and cheap to copy); None - the default, and
+        # what add_currency uses - defers to the shared module-level
+        # table.  __init__ never writes to that table itself.
+        self._countries = None if countries is None else tuple(countries)
         self.name = name
         self.numeric = numeric
+        # Number of digits after the decimal point in the currency's
+        # minor unit, e.g. 2 for USD (cents), 0 for JPY.
+        self.exponent = exponent
+        # Ready-made quantizer for rounding to the minor unit, e.g.
+        # Decimal('0.01') for USD; computing it per operation would
+        # allocate several Decimals each time.
+        self._quantum = Decimal(1).scaleb(-exponent)
+
+    @property
+    def countries(self):
+        countries = self._countries
+        if countries is not None:
+            return countries
+        return _COUNTRIES.get(self.code, ())
+
+    def __setattr__(self, name, value):
+        # Currencies are value objects identified by their code; each
+        # attribute can be written once (during __init__ or state
+        # restore) and is frozen afterwards, so registry singletons can
+        # be shared without defensive copying.
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(
+                'Currency objects are immutable; cannot set %r' % name)
+
+    def copy(self):
+        """
+        Return an independent clone of this currency.
+
+        All fields are scalars or immutable, so a flat attribute copy
+        suffices - much cheaper than copy.deepcopy's recursive dispatch.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        for name in Currency.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
 
     def __repr__(self):
         return self.code
@@ -32,6 +112,11 @@ class Currency(object):
         return (other and isinstance(other, self.__class__)
                 and self.code == other.code)
 
+    def __hash__(self):
+        # Hash on the code, matching __eq__, so currencies can be used
+        # as dict keys and in sets.
+        return hash(self.code)
+
 
 class MoneyComparisonError(TypeError):
     # This exception was needed often enough to merit its own
@@ -54,6 +139,64 @@ class CurrencyDoesNotExist(Exception):
             "No currency with code %s is defined." % code)
 
 
+# The registry is declared (and the default currency added) before the
+# Money class so that Money.__init__ can bind the lookup as a default
+# argument below.
+
+CURRENCIES = {}
+
+# Currencies indexed by their ISO 4217 numeric code, under both the
+# zero-padded string ('840') and plain int (840) forms.
+_BY_ISO = {}
+
+# Case-insensitive view of the registry: each currency is indexed under
+# its upper- and lowercase code, so Money('10', 'usd') resolves with
+# one dict hit instead of allocating an uppercased copy first.
+_CURRENCIES_CI = {}
+
+# ISO 4217 minor-unit exponents that differ from the usual 2.
+_CURRENCY_EXPONENTS = {
+    'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0,
+    'KMF': 0, 'KRW': 0, 'PYG': 0, 'RWF': 0, 'UGX': 0, 'VND': 0,
+    'VUV': 0, 'XAF': 0, 'XOF': 0, 'XPF': 0,
+    'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3,
+    'TND': 3,
+}
+
+
+def add_currency(code, numeric, name, countries):
+    global CURRENCIES
+    # Interned codes share their hash with every string-keyed lookup of
+    # the registry.
+    code = sys.intern(str(code))
+    currency = Currency(
+        code=code,
+        numeric=numeric,
+        name=name,
+        exponent=_CURRENCY_EXPONENTS.get(code, 2))
+    # Only the registry writes the shared country table; ad-hoc
+    # Currency instances cannot disturb it.
+    _COUNTRIES[code] = tuple(countries)
+    CURRENCIES[code] = currency
+    _CURRENCIES_CI[code] = currency
+    _CURRENCIES_CI[code.lower()] = currency
+    if numeric.isdigit():
+        _BY_ISO[numeric] = currency
+        _BY_ISO[int(numeric)] = currency
+    return currency
+
+
+def get_currency(code=None, iso=None):
+    try:
+        if iso is not None:
+            return _BY_ISO[iso]
+        return CURRENCIES[code]
+    except KeyError:
+        raise CurrencyDoesNotExist(code if iso is None else iso)
+
+DEFAULT_CURRENCY = add_currency(DEFAULT_CURRENCY_CODE, '999', 'Default currency.', [])
+
+
 class Money(object):
     """
     A Money instance is a combination of data - an amount and a
@@ -62,74 +205,207 @@ class Money(object):
     ($DEITY forbid) floats.
     """
 
-    def __init__(self, amount=Decimal('0.0'), currency=DEFAULT_CURRENCY_CODE):
-        if not isinstance(amount, Decimal):
-            amount = Decimal(str(amount))
-        self.amount = amount
+    # Dropping the per-instance __dict__ saves ~56 bytes per Money on
+    # 64-bit CPython and makes every self.amount/self.currency load a
+    # C-level descriptor hit.  Subclasses that want the same saving
+    # should declare __slots__ = () themselves.
+    __slots__ = ('amount', 'currency', '_cached_str')
+
+    def __init__(self, amount=Decimal('0.0'), currency=DEFAULT_CURRENCY,
+                 _Decimal=Decimal, _lookup=CURRENCIES.__getitem__,
+                 _ci_get=_CURRENCIES_CI.get, _set=object.__setattr__):
+        # The _Decimal/_lookup/_ci_get default arguments exist purely
+        # to avoid global lookups; Money construction is a hot path.
+        if not isinstance(amount, _Decimal):
+            amount = _Decimal(str(amount))
+        _set(self, 'amount', amount)
+
+        if not isinstance(currency, Currency):
+            hit = (_ci_get(currency)
+                   if type(currency) is str else None)
+            if hit is not None:
+                currency = hit
+            else:
+                try:
+                    currency = _lookup(str(currency).upper())
+                except KeyError:
+                    raise CurrencyDoesNotExist(currency)
+        _set(self, 'currency', currency)
+        _set(self, '_cached_str', None)
+
+    def __setattr__(self, name, value):
+        # Like Currency, Money is a write-once value object: freezing
+        # amount and currency after construction is what makes caching
+        # the formatted string in __str__ safe.
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(
+                'Money objects are immutable; cannot set %r' % name)
+
+    @classmethod
+    def _from_amount(cls, amount, currency, _set=object.__setattr__):
+        # Raw constructor for arithmetic results: both arguments are
+        # known to be valid already, so skip __init__ entirely.
+        money = object.__new__(cls)
+        _set(money, 'amount', amount)
+        _set(money, 'currency', currency)
+        _set(money, '_cached_str', None)
+        return money
+
+    @classmethod
+    def from_minor(cls, minor_units, currency=DEFAULT_CURRENCY,
+                   _lookup=CURRENCIES.__getitem__):
+        """
+        Build a Money from an integer amount of the currency's minor
+        unit, e.g. Money.from_minor(12345, 'USD') == Money('123.45',
+        'USD').
+        """
+        if not isinstance(currency, Currency):
+            try:
+                currency = _lookup(str(currency).upper())
+            except KeyError:
+                raise CurrencyDoesNotExist(currency)
+        return cls._from_amount(
+            Decimal(minor_units).scaleb(-currency.exponent), currency)
+
+    @classmethod
+    def factory(cls, currency):
+        """
+        Return a specialized constructor bound to one currency.
+
+        Handy for code that creates many Money values in a single
+        currency: the currency is resolved once here, and the returned
+        callable only coerces the amount.
 
+        >>> usd = Money.factory('USD')
+        >>> usd(10) == Money(10, 'USD')
+        True
+        """
         if not isinstance(currency, Currency):
             currency = get_currency(str(currency).upper())
-        self.currency = currency
+
+        def make(amount, _cls=cls, _currency=currency, _Decimal=Decimal,
+                 _set=object.__setattr__):
+            money = object.__new__(_cls)
+            _set(money, 'amount', (amount if isinstance(amount, _Decimal)
+                                   else _Decimal(str(amount))))
+            _set(money, 'currency', _currency)
+            _set(money, '_cached_str', None)
+            return money
+
+        return make
+
+    @classmethod
+    def sum(cls, amounts):
+        """
+        Add up an iterable of Money instances in a single pass.
+
+        Equivalent to the builtin sum(), but accumulates the amounts
+        directly and allocates only one Money for the result instead of
+        an intermediate per element.  An empty iterable yields a zero
+        Money in the default currency, mirroring sum()'s default start.
+        """
+        amounts = iter(amounts)
+        try:
+            first = next(amounts)
+        except StopIteration:
+            return cls()
+        if not isinstance(first, Money):
+            raise TypeError(_ADD_NON_MONEY_MSG)
+        total = first.amount
+        currency = first.currency
+        for money in amounts:
+            if not isinstance(money, Money):
+                raise TypeError(_ADD_NON_MONEY_MSG)
+            if not (currency is money.currency
+                    or currency == money.currency):
+                raise TypeError(_CURRENCY_MISMATCH_MSG)
+            total += money.amount
+        return cls._from_amount(total, currency)
 
     def __repr__(self):
         return "%s %s" % (self.amount.to_integral_value(ROUND_DOWN),
                           self.currency)
 
     def __unicode__(self):
-        from moneyed.localization import format_money
-        return format_money(self)
+        return self.__str__()
 
     def __str__(self):
-        from moneyed.localization import format_money
-        return format_money(self)
+        # Money is immutable, so the default-locale rendering can be
+        # computed once and replayed on every later call (logging is
+        # full of repeated str(money)).  The cache is stamped with the
+        # formatter's generation counter so renderings made before an
+        # application registers its own definitions are re-done.
+        from moneyed import localization
+        cached = self._cached_str
+        if cached is not None and cached[0] == localization._generation:
+            return cached[1]
+        generation = localization._generation
+        formatted = localization.format_money(self)
+        object.__setattr__(self, '_cached_str', (generation, formatted))
+        return formatted
 
     def __pos__(self):
-        return Money(
-            amount=self.amount,
-            currency=self.currency)
+        return self._from_amount(self.amount, self.currency)
 
     def __neg__(self):
-        return Money(
-            amount= -self.amount,
-            currency=self.currency)
+        return self._from_amount(-self.amount, self.currency)
 
     def __add__(self, other):
         if not isinstance(other, Money):
-            raise TypeError('Cannot add or subtract a ' +
-                            'Money and non-Money instance.')
-        if self.currency == other.currency:
-            return Money(
-                amount=self.amount + other.amount,
-                currency=self.currency)
+            raise TypeError(_ADD_NON_MONEY_MSG)
+        # Currencies resolved through the registry are singletons, so
+        # the identity check catches virtually every match; equality is
+        # only consulted for (deep)copied Currency instances.
+        if self.currency is other.currency or self.currency == other.currency:
+            return self._from_amount(self.amount + other.amount,
+                                     self.currency)
 
-        raise TypeError('Cannot add or subtract two Money ' +
-                        'instances with different currencies.')
+        raise TypeError(_CURRENCY_MISMATCH_MSG)
 
     def __sub__(self, other):
-        return self.__add__(-other)
+        if not isinstance(other, Money):
+            raise TypeError(_ADD_NON_MONEY_MSG)
+        if self.currency is other.currency or self.currency == other.currency:
+            return self._from_amount(self.amount - other.amount,
+                                     self.currency)
+
+        raise TypeError(_CURRENCY_MISMATCH_MSG)
 
     def __mul__(self, other):
         if isinstance(other, Money):
             raise TypeError('Cannot multiply two Money instances.')
         else:
-            return Money(
-                amount=(self.amount * Decimal(str(other))),
-                currency=self.currency)
+            # Exact type check on purpose: plain int multipliers are by
+            # far the most common and Decimal * int is a native fast
+            # path, skipping the Decimal(str(...)) round-trip.
+            if type(other) is int:
+                return self._from_amount(self.amount * other,
+                                         self.currency)
+            if isinstance(other, float):
+                warnings.warn(_FLOAT_MUL_WARNING, DeprecationWarning,
+                              stacklevel=2)
+            return self._from_amount(self.amount * Decimal(str(other)),
+                                     self.currency)
 
     def __truediv__(self, other):
         if isinstance(other, Money):
-            if self.currency != other.currency:
+            if not (self.currency is other.currency
+                    or self.currency == other.currency):
                 raise TypeError('Cannot divide two different currencies.')
             return self.amount / other.amount
         else:
-            return Money(
-                amount=self.amount / Decimal(str(other)),
-                currency=self.currency)
+            if isinstance(other, float):
+                warnings.warn(_FLOAT_DIV_WARNING, DeprecationWarning,
+                              stacklevel=2)
+            return self._from_amount(self.amount / Decimal(str(other)),
+                                     self.currency)
 
     def __abs__(self):
-        return Money(
-            amount=abs(self.amount),
-            currency=self.currency)
+        return self._from_amount(abs(self.amount), self.currency)
 
     def __rmod__(self, other):
         """
@@ -144,11 +420,21 @@ class Money(object):
         if isinstance(other, Money):
             raise TypeError('Invalid __rmod__ operation')
         else:
-            return Money(
-                amount=(Decimal(str(other)) * self.amount / 100),
-                currency=self.currency)
+            if isinstance(other, float):
+                warnings.warn(_FLOAT_MOD_WARNING, DeprecationWarning,
+                              stacklevel=2)
+            return self._from_amount(
+                Decimal(str(other)) * self.amount / 100,
+                self.currency)
+
+    def __radd__(self, other):
+        # Lets the builtin sum() work: its default start value of 0
+        # lands here, and returning self skips allocating an
+        # intermediate Money per element.
+        if other == 0:
+            return self
+        return self.__add__(other)
 
-    __radd__ = __add__
     __rsub__ = __sub__
     __rmul__ = __mul__
     __rtruediv__ = __truediv__
@@ -158,7 +444,8 @@ class Money(object):
     def __eq__(self, other):
         return isinstance(other, Money)\
                and (self.amount == other.amount) \
-               and (self.currency == other.currency)
+               and (self.currency is other.currency
+                    or self.currency == other.currency)
 
     def __ne__(self, other):
         result = self.__eq__(other)
@@ -167,7 +454,8 @@ class Money(object):
     def __lt__(self, other):
         if not isinstance(other, Money):
             raise MoneyComparisonError(other)
-        if (self.currency == other.currency):
+        if (self.currency is other.currency
+                or self.currency == other.currency):
             return (self.amount < other.amount)
         else:
             raise TypeError('Cannot compare Money with different currencies.')
@@ -175,44 +463,35 @@ class Money(object):
     def __gt__(self, other):
         if not isinstance(other, Money):
             raise MoneyComparisonError(other)
-        if (self.currency == other.currency):
+        if (self.currency is other.currency
+                or self.currency == other.currency):
             return (self.amount > other.amount)
         else:
             raise TypeError('Cannot compare Money with different currencies.')
 
     def __le__(self, other):
-        return self < other or self == other
+        if not isinstance(other, Money):
+            raise MoneyComparisonError(other)
+        if (self.currency is other.currency
+                or self.currency == other.currency):
+            return (self.amount <= other.amount)
+        else:
+            raise TypeError('Cannot compare Money with different currencies.')
 
     def __ge__(self, other):
-        return self > other or self == other
+        if not isinstance(other, Money):
+            raise MoneyComparisonError(other)
+        if (self.currency is other.currency
+                or self.currency == other.currency):
+            return (self.amount >= other.amount)
+        else:
+            raise TypeError('Cannot compare Money with different currencies.')
 
 
 # ____________________________________________________________________
 # Definitions of ISO 4217 Currencies
 # Source: http://www.iso.org/iso/support/faqs/faqs_widely_used_standards/widely_used_standards_other/currency_codes/currency_codes_list-1.htm
 
-CURRENCIES = {}
-
-
-def add_currency(code, numeric, name, countries):
-    global CURRENCIES
-    CURRENCIES[code] = Currency(
-        code=code,
-        numeric=numeric,
-        name=name,
-        countries=countries)
-    return CURRENCIES[code]
-
-
-def get_currency(code):
-    try:
-        return CURRENCIES[code]
-    except KeyError:
-        raise CurrencyDoesNotExist(code)
-
-DEFAULT_CURRENCY = add_currency(DEFAULT_CURRENCY_CODE, '999', 'Default currency.', [])
-
-
 AED = add_currency('AED', '784', 'UAE Dirham', ['UNITED ARAB EMIRATES'])
 AFN = add_currency('AFN', '971', 'Afghani', ['AFGHANISTAN'])
 ALL = add_currency('ALL', '008', 'Lek', ['ALBANIA'])
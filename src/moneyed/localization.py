@@ -2,10 +2,33 @@
 
 from __future__ import unicode_literals
 from decimal import Decimal, ROUND_HALF_EVEN
+from functools import lru_cache
 import moneyed
 
 DEFAULT = "default"
 
+# Bumped whenever sign or formatting definitions are (re)registered.
+# Money.__str__ stamps its per-instance cache with this counter so a
+# rendering made before runtime customization is not served forever.
+_generation = 0
+
+# Quantizers ('0.01' for two places, etc.) cached by decimal places, so
+# formatting does not recompute Decimal(10) ** -n on every call.
+_QUANTIZERS = {}
+
+
+def _bump_generation():
+    global _generation
+    _generation += 1
+
+
+def _quantizer(decimal_places):
+    try:
+        return _QUANTIZERS[decimal_places]
+    except KeyError:
+        return _QUANTIZERS.setdefault(decimal_places,
+                                      Decimal(1).scaleb(-decimal_places))
+
 
 class CurrencyFormatter(object):
 
@@ -18,6 +41,8 @@ class CurrencyFormatter(object):
         if not locale in self.sign_definitions:
             self.sign_definitions[locale] = {}
         self.sign_definitions[locale][currency_code] = (prefix, suffix)
+        _bump_generation()
+        _format_cached.cache_clear()
 
     def add_formatting_definition(self, locale, group_size,
                                   group_separator, decimal_point,
@@ -26,16 +51,27 @@ class CurrencyFormatter(object):
                                   rounding_method,
                                   decimal_places=2):
         locale = locale.upper()
+        # With the standard group size of 3, rendering can lean on the
+        # C-level ','-grouping of format() plus one str.translate with
+        # this precomputed table, instead of grouping digit by digit.
+        if group_separator == ',' and decimal_point == '.':
+            translation = None
+        else:
+            translation = str.maketrans({',': group_separator,
+                                         '.': decimal_point})
         self.formatting_definitions[locale] = {
             'group_size': group_size,
             'group_separator': group_separator,
             'decimal_point': decimal_point,
+            'translation': translation,
             'positive_sign': positive_sign,
             'trailing_positive_sign': trailing_positive_sign,
             'negative_sign': negative_sign,
             'trailing_negative_sign': trailing_negative_sign,
             'rounding_method': rounding_method,
             'decimal_places': decimal_places}
+        _bump_generation()
+        _format_cached.cache_clear()
 
     def get_sign_definition(self, currency_code, locale):
         currency_code = currency_code.upper()
@@ -59,8 +95,17 @@ class CurrencyFormatter(object):
 
     def format(self, money, include_symbol=True, locale=DEFAULT,
                decimal_places=None, rounding_method=None):
+        # Formatting identical values is common (logging, UIs), so the
+        # heavy lifting is delegated to a memoized helper.  The amount
+        # is normalized to get a canonical cache key.
+        return _format_cached(str(money.amount.normalize()),
+                              money.currency.code, include_symbol,
+                              locale, decimal_places, rounding_method)
+
+    def _format(self, amount, currency_code, include_symbol, locale,
+                decimal_places, rounding_method):
         locale = locale.upper()
-        code = money.currency.code.upper()
+        code = currency_code.upper()
         prefix, suffix = self.get_sign_definition(code, locale)
         formatting = self.get_formatting_definition(locale)
 
@@ -70,8 +115,27 @@ class CurrencyFormatter(object):
         if decimal_places is None:
             decimal_places = formatting['decimal_places']
 
-        q = Decimal(10) ** -decimal_places  # 2 places --> '0.01'
-        quantized = money.amount.quantize(q, rounding_method)
+        q = _quantizer(decimal_places)  # 2 places --> '0.01'
+        quantized = amount.quantize(q, rounding_method)
+
+        # Fast path: every shipped locale groups by threes, which is
+        # exactly what format()'s ',' option produces.
+        if formatting['group_size'] == 3:
+            negative = quantized.is_signed()
+            body = format(quantized.copy_abs(), ',.%df' % decimal_places)
+            translation = formatting['translation']
+            if translation is not None:
+                body = body.translate(translation)
+            if negative:
+                sign = formatting['negative_sign']
+                trailing_sign = formatting['trailing_negative_sign']
+            else:
+                sign = formatting['positive_sign']
+                trailing_sign = formatting['trailing_positive_sign']
+            if include_symbol:
+                return sign + prefix + body + suffix + trailing_sign
+            return sign + body + trailing_sign
+
         negative, digits, e = quantized.as_tuple()
 
         result = []
@@ -124,6 +188,14 @@ class CurrencyFormatter(object):
 
 _FORMATTER = CurrencyFormatter()
 
+
+@lru_cache(maxsize=4096)
+def _format_cached(amount_str, currency_code, include_symbol, locale,
+                   decimal_places, rounding_method):
+    return _FORMATTER._format(Decimal(amount_str), currency_code,
+                              include_symbol, locale, decimal_places,
+                              rounding_method)
+
 format_money = _FORMATTER.format
 
 _sign = _FORMATTER.add_sign_definition
@@ -5,8 +5,9 @@ from __future__ import unicode_literals
 from decimal import Decimal
 import pytest  # Works with less code, more consistency than unittest.
 
-from moneyed.classes import Currency, Money, MoneyComparisonError, CURRENCIES, DEFAULT_CURRENCY
-from moneyed.localization import format_money
+from moneyed.classes import Currency, Money, MoneyComparisonError, CURRENCIES, DEFAULT_CURRENCY, get_currency
+from moneyed.localization import format_money, _FORMATTER
+from moneyed.batch import add_minor, from_minor, sum_minor
 
 
 class TestCurrency:
@@ -41,9 +42,34 @@ class TestCurrency:
         assert US_dollars.name == 'US Dollar'
         assert US_dollars.numeric == '840'
 
+    def test_init_does_not_mutate_registry(self):
+        registered = CURRENCIES['USD'].countries
+        ad_hoc = Currency(code='USD', countries=['NOWHERE LAND'])
+        assert ad_hoc.countries == ('NOWHERE LAND',)
+        assert CURRENCIES['USD'].countries == registered
+        assert Currency(code='USD', countries=[]).countries == ()
+
     def test_repr(self):
         assert str(self.default_curr) == self.default_curr_code
 
+    def test_hash(self):
+        assert self.default_curr in {CURRENCIES[self.default_curr_code]}
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            self.default_curr.code = 'USD'
+
+    def test_copy(self):
+        clone = self.default_curr.copy()
+        assert clone is not self.default_curr
+        assert clone == self.default_curr
+        assert clone.countries == self.default_curr.countries
+
+    def test_fetching_currency_by_iso_code(self):
+        assert get_currency('USD') == CURRENCIES['USD']
+        assert get_currency(iso='840') == CURRENCIES['USD']
+        assert get_currency(iso=840) == CURRENCIES['USD']
+
 
 class TestMoney:
 
@@ -75,6 +101,12 @@ class TestMoney:
         one_million_dollars = Money(amount=1000000.0)
         assert one_million_dollars.amount == self.one_million_decimal
 
+    def test_factory(self):
+        usd_money = Money.factory(self.USD)
+        assert usd_money(1000000) == self.one_million_bucks
+        assert usd_money('2.50') == Money('2.50', currency=self.USD)
+        assert Money.factory('usd')(5) == Money(amount=5, currency=self.USD)
+
     def test_repr(self):
         assert repr(self.one_million_bucks) == '1000000 USD'
         assert repr(Money(Decimal('2.000'), 'PLN')) == '2 PLN'
@@ -84,6 +116,22 @@ class TestMoney:
 
     def test_str(self):
         assert str(self.one_million_bucks) == 'US$1,000,000.00'
+        # Repeated calls replay the cached rendering.
+        assert str(self.one_million_bucks) is str(self.one_million_bucks)
+
+    def test_str_cache_invalidated_by_new_definitions(self):
+        money = Money(amount=1, currency=self.USD)
+        first = str(money)
+        # Registering any definition (an otherwise unused locale here)
+        # must invalidate cached renderings.
+        _FORMATTER.add_sign_definition('xx_XX', self.USD, prefix='$')
+        second = str(money)
+        assert second == first
+        assert second is not first
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            self.one_million_bucks.amount = Decimal('2')
 
     def test_format_money(self):
         # Two decimal places by default
@@ -111,6 +159,25 @@ class TestMoney:
         zeroed_test = self.one_million_bucks - self.one_million_bucks
         assert zeroed_test == Money(amount=0, currency=self.USD)
 
+    def test_sum(self):
+        money_list = [Money(amount=2, currency=self.USD),
+                      Money(amount='2.99', currency=self.USD)]
+        expected = Money(amount='4.99', currency=self.USD)
+        assert sum(money_list) == expected
+        assert Money.sum(money_list) == expected
+        assert Money.sum([]) == Money(amount=0)
+
+    def test_sum_non_money(self):
+        with pytest.raises(TypeError):
+            Money.sum([1, Money(amount=1, currency=self.USD)])
+        with pytest.raises(TypeError):
+            Money.sum([Money(amount=1, currency=self.USD), 1])
+
+    def test_sum_different_currencies(self):
+        with pytest.raises(TypeError):
+            Money.sum([Money(amount=1, currency=self.USD),
+                       Money(amount=1, currency=CURRENCIES['CAD'])])
+
     def test_sub_non_money(self):
         with pytest.raises(TypeError):
             Money(1000) - 123
@@ -120,6 +187,10 @@ class TestMoney:
         assert 3 * x == Money(333.99, currency=self.USD)
         assert Money(333.99, currency=self.USD) == 3 * x
 
+    def test_mul_float_warning(self):
+        with pytest.warns(DeprecationWarning, match='Multiplying Money'):
+            Money(amount='10') * 1.2
+
     def test_mul_bad(self):
         with pytest.raises(TypeError):
             self.one_million_bucks * self.one_million_bucks
@@ -129,6 +200,10 @@ class TestMoney:
         y = Money(amount=2, currency=self.USD)
         assert x / y == Decimal(25)
 
+    def test_div_float_warning(self):
+        with pytest.warns(DeprecationWarning, match='Dividing Money'):
+            Money(amount='10') / 1.2
+
     def test_div_mismatched_currencies(self):
         x = Money(amount=50, currency=self.USD)
         y = Money(amount=2, currency=CURRENCIES['CAD'])
@@ -144,6 +219,10 @@ class TestMoney:
         assert 1 % self.one_million_bucks == Money(amount=10000,
                                                    currency=self.USD)
 
+    def test_rmod_float_warning(self):
+        with pytest.warns(DeprecationWarning, match='percentages of Money'):
+            2.2 % Money(amount='10')
+
     def test_rmod_bad(self):
         with pytest.raises(TypeError):
             assert (self.one_million_bucks % self.one_million_bucks
@@ -194,3 +273,43 @@ class TestMoney:
         assert abs(x) == abs_money
         y = Money(amount=1, currency=self.USD)
         assert abs(x) == abs_money
+
+    def test_arithmetic_operations_return_real_subclass_instance(self):
+        one = ExtendedMoney(amount=1, currency=self.USD)
+        two = ExtendedMoney(amount=2, currency=self.USD)
+        assert type(one) == type(+one)
+        assert type(one) == type(-one)
+        assert type(one) == type(abs(-one))
+        assert type(one) == type(one + one)
+        assert type(one) == type(two - one)
+        assert type(one) == type(one * 2)
+        assert type(one) == type(two / 2)
+        assert type(one) == type(2 % two)
+        # The subclass' own behaviour is still available on results.
+        (one + one).do_my_behaviour()
+
+
+class TestBatch:
+
+    def test_sum_minor(self):
+        assert sum_minor([100, 250, 399]) == 749
+
+    def test_add_minor(self):
+        assert add_minor([100, 200], [5, 10]) == [105, 210]
+
+    def test_from_minor(self):
+        usd = CURRENCIES['USD']
+        assert Money.from_minor(12345, usd) == Money('123.45', usd)
+        assert Money.from_minor(12345, 'usd') == Money('123.45', usd)
+        # Zero-decimal currencies: minor units are whole units.
+        assert Money.from_minor(500, 'JPY') == Money(500, 'JPY')
+        assert from_minor([100, 250], usd) == [Money(1, usd),
+                                               Money('2.50', usd)]
+
+
+class ExtendedMoney(Money):
+
+    __slots__ = ()
+
+    def do_my_behaviour(self):
+        pass